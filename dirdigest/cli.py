@@ -1,3 +1,4 @@
+import datetime
 import functools  # Added for cmp_to_key
 import json as json_debugger  # For debug tree printing
 import logging
@@ -341,6 +342,8 @@ def main_cli(
     root_node, metadata_for_output = core.build_digest_tree(
         final_directory, iter(processed_items_list), stats_from_core
     )
+    # Stamp the creation time once per run; formatters read it from the metadata
+    metadata_for_output["created_at"] = datetime.datetime.now().isoformat()
     log.debug(f"CLI: Digest tree built. Root node children: {len(root_node.get('children', []))}")
     log.debug(f"CLI: Metadata for output: {metadata_for_output}")
 
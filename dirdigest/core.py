@@ -5,7 +5,7 @@ from typing import Any, Dict, Generator, Iterator, List, Tuple
 
 from dirdigest.constants import DEFAULT_IGNORE_PATTERNS
 from dirdigest.utils.logger import logger  # Import the configured logger
-from dirdigest.utils.patterns import is_path_hidden, matches_patterns
+from dirdigest.utils.patterns import compile_patterns, is_path_hidden
 
 # Type hints for clarity
 LogEvent = Dict[str, Any]  # Added type hint for log events
@@ -61,6 +61,12 @@ def process_directory_recursive(
         effective_exclude_patterns.extend(DEFAULT_IGNORE_PATTERNS)
 
     logger.debug(f"Core: Effective exclude patterns count: {len(effective_exclude_patterns)}")
+
+    # The pattern lists do not change during the walk, so their matchers are built once here
+    matches_exclude_patterns = compile_patterns(exclude_patterns)
+    matches_default_ignore_patterns = compile_patterns(DEFAULT_IGNORE_PATTERNS)
+    matches_include_patterns = compile_patterns(include_patterns)
+    matches_effective_exclude_patterns = compile_patterns(effective_exclude_patterns)
     logger.debug(f"Core: Max size KB: {max_size_kb}, Ignore read errors: {ignore_read_errors}")
     logger.debug(f"Core: Follow symlinks: {follow_symlinks}, No default ignore: {no_default_ignore}")
 
@@ -90,13 +96,13 @@ def process_directory_recursive(
 
                 if not follow_symlinks and file_path_obj.is_symlink():
                     reason_file_excluded = "Is a symlink (symlink following disabled)"
-                elif is_path_hidden(relative_file_path) and not no_default_ignore:
+                elif not no_default_ignore and is_path_hidden(relative_file_path_str):
                     reason_file_excluded = "Is a hidden file"
-                elif matches_patterns(relative_file_path_str, exclude_patterns):
+                elif matches_exclude_patterns(relative_file_path_str):
                     reason_file_excluded = "Matches user-specified exclude pattern"
-                elif not no_default_ignore and matches_patterns(relative_file_path_str, DEFAULT_IGNORE_PATTERNS):
+                elif not no_default_ignore and matches_default_ignore_patterns(relative_file_path_str):
                     reason_file_excluded = "Matches default ignore pattern"
-                elif include_patterns and not matches_patterns(relative_file_path_str, include_patterns):
+                elif include_patterns and not matches_include_patterns(relative_file_path_str):
                     reason_file_excluded = "Does not match any include pattern"
 
                 if reason_file_excluded:
@@ -173,9 +179,9 @@ def process_directory_recursive(
                     reason_dir_excluded = "Exceeds max depth"
                 elif not follow_symlinks and dir_path_obj.is_symlink():
                     reason_dir_excluded = "Is a symlink (symlink following disabled)"
-                elif is_path_hidden(relative_dir_path) and not no_default_ignore:
+                elif not no_default_ignore and is_path_hidden(relative_dir_path_str):
                     reason_dir_excluded = "Is a hidden directory"
-                elif matches_patterns(relative_dir_path_str, effective_exclude_patterns):
+                elif matches_effective_exclude_patterns(relative_dir_path_str):
                     reason_dir_excluded = "Matches an exclude pattern"
 
                 if reason_dir_excluded:
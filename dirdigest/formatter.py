@@ -1,9 +1,18 @@
 # dirdigest/dirdigest/formatter.py
 import datetime
+import functools
+import io
 import json
+import os
 import re
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List  # Changed from dict, list to Dict, List
+from typing import Any, Dict, List, Tuple  # Changed from dict, list to Dict, List
+
+try:  # Optional: orjson is a much faster JSON encoder; the stdlib json module is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from dirdigest.constants import TOOL_VERSION  # Import TOOL_VERSION
 from dirdigest.core import DigestItemNode, LogEvent  # Import the type hint & LogEvent
@@ -19,56 +28,90 @@ RICH_TAG_RE = re.compile(r"\[/?log\.[^\]]+\]")
 # Define the target column for the colon to align
 TARGET_COL = 53  # Choose a column wide enough to accommodate most log event descriptions
 
+# Pre-built padding strings indexed by the visible length of the left part,
+# so aligning the colon is a single list lookup instead of a regex pass per event.
+_PADDING_TABLE = [" " * (TARGET_COL - length) for length in range(TARGET_COL)]
 
-def format_log_event_for_cli(log_event: LogEvent) -> str:
-    """
-    Formats a single log event dictionary into a string for CLI display,
-    with alignment based on the colon.
-    """
-    status = log_event.get("status", "unknown")
-    item_type = log_event.get("item_type", "item")
-    path = log_event.get("path", "")
-    size_kb = log_event.get("size_kb", 0.0)
-    reason = log_event.get("reason")
+# Length of the fixed characters around the size value. RICH_TAG_RE only strips
+# "[log.*]" tags, so the grey39 tags have always counted towards the alignment.
+_SIZE_PART_FIXED_LEN = len("[grey39] (KB)[/grey39]")
 
-    # Capitalize status for display
-    display_status = status.capitalize()
 
-    # Determine prefix for item_type based on its value
-    item_type_prefix = "  " if item_type == "file" else ""
+# Statuses whose log lines carry the event's reason, when one is present
+_STATUSES_WITH_REASON = frozenset(("excluded", "error"))
 
-    # Prepare size string, formatted to two decimal places
-    try:
-        formatted_size = f"{float(size_kb):.2f}"
-    except (ValueError, TypeError):
-        formatted_size = "N/A"
 
-    # Construct the size part to be inserted
-    size_part = f"[grey39] ({formatted_size}KB)[/grey39]"
+def _make_status_tags(status: str) -> Tuple[str, str, str, bool]:
+    """Builds the (open tag, display text, close tag, shows reason) entry for a log status."""
+    return f"[log.{status}]", f"{status.capitalize()} ", f"[/log.{status}]", status in _STATUSES_WITH_REASON
 
-    # Construct the left part of the message (before the colon), including Rich tags
-    left_part_with_markup = f"[log.{status}]{display_status} {item_type_prefix}{item_type}{size_part}[/log.{status}]"
 
-    # Calculate the visible length of the left part by stripping Rich tags
-    visible_left_part_content = RICH_TAG_RE.sub("", left_part_with_markup)
-    current_length = len(visible_left_part_content)
+# Events built by core always carry these keys, so they can be read in one call
+_LOG_EVENT_FIELDS = itemgetter("status", "item_type", "path", "size_kb", "reason")
 
-    # Calculate padding needed to align the colon
-    padding = ""
-    if current_length < TARGET_COL:
-        padding_length = TARGET_COL - current_length
-        padding = " " * padding_length
+# Item type labels as shown in the log; files are indented under their folders.
+# Other item types are shown as-is.
+_ITEM_TYPE_LABELS = {"file": "  file", "folder": "folder"}
 
-    # Main message part, now including padding before the colon
-    message = f"{left_part_with_markup}{padding}: [log.path]{path}[/log.path]"
+# Markup fragments for the statuses emitted by core, built once instead of per event.
+# Unknown statuses fall back to _make_status_tags.
+_STATUS_TAGS = {status: _make_status_tags(status) for status in ("included", "excluded", "error")}
 
-    # Append reason if excluded and reason is present
-    if status == "excluded" and reason:
-        message += f" ([log.reason]{reason}[/log.reason])"
-    elif status == "error" and reason:  # Also show reason for errors
-        message += f" ([log.reason]{reason}[/log.reason])"
 
-    return message
+def format_log_event_for_cli(log_event: LogEvent) -> str:
+    """
+    Formats a single log event dictionary into a string for CLI display,
+    with alignment based on the colon.
+    """
+    try:
+        status, item_type, path, size_kb, reason = _LOG_EVENT_FIELDS(log_event)
+    except KeyError:  # Partial event; fall back to defaults for the missing keys
+        status = log_event.get("status", "unknown")
+        item_type = log_event.get("item_type", "item")
+        path = log_event.get("path", "")
+        size_kb = log_event.get("size_kb", 0.0)
+        reason = log_event.get("reason")
+
+    open_tag, display_status, close_tag, shows_reason = _STATUS_TAGS.get(status) or _make_status_tags(status)
+
+    item_type_label = _ITEM_TYPE_LABELS.get(item_type, item_type)
+
+    # Prepare size string, formatted to two decimal places. core always reports
+    # floats, so only other values go through the guarded float() conversion.
+    if type(size_kb) is float:
+        formatted_size = format(size_kb, ".2f")
+    else:
+        try:
+            formatted_size = format(float(size_kb), ".2f")
+        except (ValueError, TypeError):
+            formatted_size = "N/A"
+
+    # The visible length is the sum of the variable-length components; the markup
+    # tags are not counted, so there is no need to strip them with a regex.
+    current_length = len(display_status) + len(item_type_label) + len(formatted_size) + _SIZE_PART_FIXED_LEN
+
+    # Look up the padding needed to align the colon
+    padding = _PADDING_TABLE[current_length] if current_length < TARGET_COL else ""
+
+    message_parts = [
+        open_tag,
+        display_status,
+        item_type_label,
+        "[grey39] (",
+        formatted_size,
+        "KB)[/grey39]",
+        close_tag,
+        padding,
+        ": [log.path]",
+        path,
+        "[/log.path]",
+    ]
+
+    # Append reason if present for excluded and error events
+    if shows_reason and reason:
+        message_parts.extend((" ([log.reason]", reason, "[/log.reason])"))
+
+    return "".join(message_parts)
 
 
 class BaseFormatter:
@@ -87,8 +130,11 @@ class BaseFormatter:
         """Prepares the full metadata object for the output."""
         # Start with metadata from core (counts, sizes)
         meta = dict(self.core_metadata)  # Make a copy
+        # The CLI stamps created_at once per run so every formatter reports the same time;
+        # it is re-inserted after tool_version to keep the key order stable.
+        created_at = meta.pop("created_at", None) or datetime.datetime.now().isoformat()
         meta["tool_version"] = TOOL_VERSION
-        meta["created_at"] = datetime.datetime.now().isoformat()
+        meta["created_at"] = created_at
         # base_directory is already in core_metadata
         return meta
 
@@ -99,64 +145,65 @@ class BaseFormatter:
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
-    def _get_file_extension(self, file_path: str) -> str:
-        """Helper to get file extension for language hints."""
-        return Path(file_path).suffix.lstrip(".").lower()
-
-    def _generate_directory_structure_string(
-        self, node: DigestItemNode, indent: str = ""
-    ) -> List[str]:  # Removed base_path_len as it's not used
-        """
-        Helper to generate a text-based directory tree for Markdown.
-        Adjusted to handle the structure from build_digest_tree.
-        """
-        lines = []
-        node_display_name = Path(node["relative_path"]).name if node["relative_path"] != "." else "."
-
-        # For the root, we don't add it with indent/prefix here, it's handled by the caller or initial line.
-        # This function is more for rendering children of a node.
-        # However, the current MarkdownFormatter calls it with the root node.
-        # Let's adjust: if it's the root, just print its name.
-        if indent == "" and node_display_name == ".":  # Special handling for the first call with root
-            lines.append(node_display_name)
-        # else: # This would be for rendering a node that's already prefixed by its parent
-        #     lines.append(f"{indent}{node_display_name}") # This line is redundant if called as designed below
-
-        if node["type"] == "folder" and "children" in node and node["children"]:
-            children_sorted = node["children"]  # Already sorted by build_digest_tree
-
-            for i, child_node in enumerate(children_sorted):
-                is_last = i == len(children_sorted) - 1
-                prefix = "└── " if is_last else "├── "
-                # Corrected variable name:
-                child_indent_continuation = "    " if is_last else "│   "
-
-                child_display_name = Path(child_node["relative_path"]).name
-
-                if child_node["type"] == "folder":
-                    lines.append(f"{indent}{prefix}{child_display_name}/")
-                    # Pass the indent for the children of this child_node
-                    lines.extend(
-                        self._generate_directory_structure_string(child_node, indent + child_indent_continuation)
-                    )
-                else:  # file
-                    lines.append(f"{indent}{prefix}{child_display_name}")
-        return lines
-
-    def _collect_file_contents_for_markdown(self, node: DigestItemNode, files_list: List) -> None:
+    def _walk_tree_for_markdown(self, root_node: DigestItemNode, structure_lines: List[str], files_list: List) -> None:
         """
-        Recursively collects file paths and contents for Markdown output.
-        Ensures files are collected in a sorted order (traversal order).
+        Walks the tree once, collecting both the text-based directory tree lines and
+        the file paths and contents for Markdown output.
+        Children are already sorted by build_digest_tree, so both lists come out in traversal order.
+        The walk uses an explicit stack rather than recursion, so deep trees cost no
+        Python frames and cannot hit the recursion limit.
         """
-        if node["type"] == "file" and "content" in node and node["content"] is not None:
+        if root_node["type"] == "file":
+            self._append_file_content_for_markdown(root_node, files_list)
+            return
+
+        # The root ('relative_path': '.') is printed by name only, without a tree prefix
+        if root_node["relative_path"] == ".":
+            structure_lines.append(".")
+
+        # Stack of (node, indent, is_last). Children are pushed in reverse so they
+        # are popped, and therefore rendered, in their sorted order.
+        stack: List[Tuple[DigestItemNode, str, bool]] = []
+
+        def push_children(node: DigestItemNode, indent: str) -> None:
+            children = node.get("children")
+            if children:
+                last_index = len(children) - 1
+                for i in range(last_index, -1, -1):
+                    stack.append((children[i], indent, i == last_index))
+
+        push_children(root_node, "")
+        while stack:
+            node, indent, is_last = stack.pop()
+            prefix = "└── " if is_last else "├── "
+            # relative_path is built by core with os.sep, so the last segment is the name
+            display_name = node["relative_path"].rpartition(os.sep)[2]
+
+            if node["type"] == "folder":
+                structure_lines.append(f"{indent}{prefix}{display_name}/")
+                # Indent for the children of this node
+                push_children(node, indent + ("    " if is_last else "│   "))
+            else:  # file
+                structure_lines.append(f"{indent}{prefix}{display_name}")
+                self._append_file_content_for_markdown(node, files_list)
+
+    def _append_file_content_for_markdown(self, node: DigestItemNode, files_list: List) -> None:
+        """Appends a file node's path and content (or read error) for Markdown output."""
+        content = node.get("content")
+        if content is not None:
+            relative_path = node["relative_path"]
+            # Language hint: the extension as Path(relative_path).suffix would give it, without
+            # building a Path per file. A leading dot (hidden file) does not start an extension.
+            name = relative_path.rpartition(os.sep)[2]
+            dot_index = name.rfind(".")
             files_list.append(
                 {
-                    "relative_path": node["relative_path"],
-                    "content": node["content"],
-                    "lang_hint": self._get_file_extension(node["relative_path"]),
+                    "relative_path": relative_path,
+                    "content": content,
+                    "lang_hint": name[dot_index + 1 :].lower() if dot_index > 0 else "",
                 }
             )
-        elif node["type"] == "file" and node.get("read_error"):
+        elif node.get("read_error"):
             files_list.append(
                 {
                     "relative_path": node["relative_path"],
@@ -165,28 +212,71 @@ class BaseFormatter:
                 }
             )
 
-        if node["type"] == "folder" and "children" in node:
-            # Children are already sorted by build_digest_tree
-            for child in node["children"]:
-                self._collect_file_contents_for_markdown(child, files_list)
+
+@functools.lru_cache(maxsize=64)
+def _code_fence(lang_hint: str) -> str:
+    """Returns the opening code fence line for a language hint; digests share a handful of hints."""
+    return f"```{lang_hint}\n"
+
+
+# Lone surrogates, as left in str by the surrogateescape error handler
+_SURROGATE_RE = re.compile("[\\ud800-\\udfff]")
+
+
+def _escape_surrogate(match: "re.Match[str]") -> str:
+    """Returns the JSON \\uXXXX escape for a lone surrogate character."""
+    return f"\\u{ord(match.group()):04x}"
+
+
+def _json_default_serializer(obj: Any) -> str:
+    """Serializes the Path values that may appear in metadata."""
+    if isinstance(obj, Path):  # Should not be in data_tree, but good for metadata
+        return str(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
 
 class JsonFormatter(BaseFormatter):
     """Formats the directory digest as JSON."""
 
+    # Feature flag: encode with orjson when it is installed. For the values dirdigest
+    # emits (strings, ints, floats rounded to 3 decimals) both encoders produce the same
+    # 2-space indented, non-ASCII-preserving output. They differ elsewhere: orjson writes
+    # 1e-5/1e16 where json writes 1e-05/1e+16 and writes null for NaN, so new metadata
+    # fields must keep to values both encode alike. Digests orjson refuses to encode
+    # (lone surrogates, integers wider than 64 bits) fall back to json.
+    use_orjson: bool = orjson is not None
+
     def format(self, data_tree: DigestItemNode) -> str:
         """
         Generates a JSON string representation of the directory digest.
         data_tree is the root_node from core.build_digest_tree.
+
+        Non-ASCII characters (common in file contents) are written as-is rather than
+        as \\uXXXX escapes. Lone surrogates (undecodable bytes in file names, which
+        os.walk decodes with surrogateescape) are still escaped so the output remains
+        encodable as UTF-8.
         """
         output_data = {"metadata": self.final_metadata, "root": data_tree}
 
-        def default_serializer(obj):
-            if isinstance(obj, Path):  # Should not be in data_tree, but good for metadata
-                return str(obj)
-            raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-
-        return json.dumps(output_data, indent=2, default=default_serializer)
+        if self.use_orjson and orjson is not None:
+            try:
+                return orjson.dumps(
+                    output_data, default=_json_default_serializer, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:  # A TypeError subclass
+                # orjson rejects what json accepts: lone surrogates (undecodable file names)
+                # and integers wider than 64 bits. Encode those digests with json instead.
+                pass
+
+        # core builds data_tree from plain str/int/float/None values, so encode without a
+        # default= first and only retry with the Path serializer if something else turns up.
+        try:
+            json_output = json.dumps(output_data, indent=2, ensure_ascii=False)
+        except TypeError:
+            json_output = json.dumps(output_data, indent=2, ensure_ascii=False, default=_json_default_serializer)
+        # Surrogates can only occur inside JSON strings, so escaping them in place gives
+        # the same \\udcXX text ensure_ascii=True would have written.
+        return _SURROGATE_RE.sub(_escape_surrogate, json_output)
 
 
 class MarkdownFormatter(BaseFormatter):
@@ -197,45 +287,49 @@ class MarkdownFormatter(BaseFormatter):
         Generates a Markdown string representation of the directory digest.
         data_tree is the root_node from core.build_digest_tree.
         """
-        md_lines = []
+        # The digest is written into a single growing buffer rather than a list of
+        # lines (including every file's full content) that is joined at the end.
+        # Each write ends with its own newline; blank lines are written as "\n".
+        buf = io.StringIO()
+        write = buf.write
 
         # 1. Header Section
-        md_lines.append(f"# Directory Digest: {self.final_metadata['base_directory']}")
-        md_lines.append(
-            f"\n*Generated by dirdigest v{self.final_metadata['tool_version']} on {self.final_metadata['created_at']}*"
+        write(f"# Directory Digest: {self.final_metadata['base_directory']}\n")
+        write("\n")
+        write(
+            f"*Generated by dirdigest v{self.final_metadata['tool_version']} on {self.final_metadata['created_at']}*\n"
         )
-        md_lines.append(
-            f"*Included files: {self.final_metadata['included_files_count']}, Total content size: {self.final_metadata['total_content_size_kb']:.2f} KB*"
+        write(
+            f"*Included files: {self.final_metadata['included_files_count']}, Total content size: {self.final_metadata['total_content_size_kb']:.2f} KB*\n"
         )
         # Add excluded_files_count when available
-        md_lines.append("\n---")
+        write("\n---\n")
 
         # 2. Directory Structure Visualization
-        md_lines.append("\n## Directory Structure")
-        # The root node itself ('relative_path': '.') shouldn't have a prefix like '├──'
-        # The _generate_directory_structure_string starts with the name of the node.
-        # We need to pass the root node directly to the helper.
-        structure_lines = self._generate_directory_structure_string(data_tree)
-        md_lines.append("\n```text")  # Use text to avoid markdown interpreting it
-        md_lines.extend(structure_lines)
-        md_lines.append("```\n")
-        md_lines.append("\n---")
+        write("\n## Directory Structure\n")
+        # A single walk of the tree yields both the structure and the file contents
+        structure_lines: List[str] = []
+        collected_files: List[Dict[str, Any]] = []
+        self._walk_tree_for_markdown(data_tree, structure_lines, collected_files)
+        write("\n```text\n")  # Use text to avoid markdown interpreting it
+        if structure_lines:
+            # One join for the whole structure block instead of two writes per line
+            write("\n".join(structure_lines))
+            write("\n")
+        write("```\n\n")
+        write("\n---\n")
 
         # 3. File Contents
-        md_lines.append("\n## Contents")
-
-        collected_files: List[Dict[str, Any]] = []
-        self._collect_file_contents_for_markdown(data_tree, collected_files)
+        write("\n## Contents\n")
 
         if not collected_files:
-            md_lines.append("\n*No files with content to display.*")
+            write("\n*No files with content to display.*\n")
         else:
             for file_info in collected_files:
-                md_lines.append(f"\n### `./{file_info['relative_path']}`")  # Ensure ./ prefix
-                lang_hint = file_info["lang_hint"] if file_info["lang_hint"] else ""
-                md_lines.append(f"```{lang_hint}")
-                md_lines.append(file_info["content"])
-                md_lines.append("```")
-
-        md_lines.append("\n")  # Trailing newline for cleanliness
-        return "\n".join(md_lines)
+                write(f"\n### `./{file_info['relative_path']}`\n")  # Ensure ./ prefix
+                write(_code_fence(file_info["lang_hint"] or ""))
+                write(file_info["content"])
+                write("\n```\n")
+
+        write("\n")  # Trailing newline for cleanliness
+        return buf.getvalue()
@@ -1,7 +1,9 @@
-import pyperclip  # type: ignore[import-untyped]
-
 from dirdigest.utils.logger import logger
 
+# Result of the first is_clipboard_available() probe. The probe may spawn a
+# subprocess (e.g. xclip/xsel on Linux), so it is only run once per process.
+_CLIPBOARD_AVAILABLE: bool | None = None
+
 
 def copy_to_clipboard(text: str) -> bool:
     """
@@ -13,6 +15,10 @@ def copy_to_clipboard(text: str) -> bool:
     if not text:
         logger.debug("Clipboard: No text provided to copy.")
         return False
+    # Imported on first use, so runs that never touch the clipboard (e.g. --no-clipboard
+    # or --help) do not pay for the import
+    import pyperclip  # type: ignore[import-untyped]
+
     try:
         pyperclip.copy(text)
         # Success message is now handled by the caller (cli.py)
@@ -35,12 +41,19 @@ def copy_to_clipboard(text: str) -> bool:
 def is_clipboard_available() -> bool:
     """
     Checks if the clipboard functionality seems to be available.
-    Tries a benign paste operation.
+    Tries a benign paste operation the first time and caches the result.
     """
+    global _CLIPBOARD_AVAILABLE
+    if _CLIPBOARD_AVAILABLE is not None:
+        return _CLIPBOARD_AVAILABLE
+
+    import pyperclip  # type: ignore[import-untyped]
+
     try:
         pyperclip.paste()
-        return True
+        _CLIPBOARD_AVAILABLE = True
     except pyperclip.PyperclipException:
-        return False
+        _CLIPBOARD_AVAILABLE = False
     except Exception:
-        return False
+        _CLIPBOARD_AVAILABLE = False
+    return _CLIPBOARD_AVAILABLE
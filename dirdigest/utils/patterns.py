@@ -1,71 +1,265 @@
 # dirdigest/utils/patterns.py
 import fnmatch
+import functools
 import os
-from pathlib import Path
-from typing import List  # Ensure List is imported
+import re
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, List, NamedTuple, Tuple  # Ensure List is imported
 
 
-def matches_pattern(path_str: str, pattern_str: str) -> bool:
+@dataclass(slots=True, frozen=True)
+class _ParsedPattern:
     """
-    Checks if the given path_str matches the pattern_str.
-    Handles common cases like 'dirname/', '**/dirname/', '*.ext', '**/file.ext'.
+    The parts of a pattern string that matching depends on, parsed once per pattern.
+    A slots dataclass: plain attribute reads, no tuple indexing, and immutable so it can be cached.
     """
-    path_obj = Path(path_str)
-    # Normalize pattern: replace os.sep with /, then process.
-    norm_pattern = pattern_str.replace(os.sep, "/")
+
+    is_dir_pattern: bool  # Pattern ends in "/": match target against every path component
+    is_basename_pattern: bool  # File pattern starting with "**/": match target against the base name
+    target: str  # Glob to match; for other patterns, matched against the full relative path
+    regex: "re.Pattern[str]"  # target compiled once, as fnmatch.fnmatch would translate it
+    literal: str | None  # Normcased target if it has no glob characters; matched by plain string equality
+    suffix: str | None  # For "*" followed by a literal (e.g. "*.pyc"), the normcased literal; matched with endswith
+
+
+# Finds the first glob special character; a single C-level scan of the pattern
+_HAS_GLOB = re.compile(r"[*?\[]").search
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_glob(glob: str) -> "re.Pattern[str]":
+    """
+    Compiles a glob the way fnmatch.fnmatch does, so matching is a single regex call.
+    Cached by glob, as different patterns (e.g. "node_modules/" and "**/node_modules/") share a target.
+    """
+    glob = os.path.normcase(glob)
+    if not _HAS_GLOB(glob):
+        # Literal names like "LICENSE" or "node_modules" need no glob translation
+        return re.compile(re.escape(glob) + r"\Z")
+    return re.compile(fnmatch.translate(glob))
+
+
+def _new_parsed_pattern(is_dir_pattern: bool, is_basename_pattern: bool, target: str) -> _ParsedPattern:
+    """Builds a _ParsedPattern, compiling the target and noting whether it is a literal or a literal suffix."""
+    normcased_target = os.path.normcase(target)
+    literal = None if _HAS_GLOB(normcased_target) else normcased_target
+    # A leading "*" matches any prefix (including "/"), so "*<literal>" is an endswith check
+    suffix = normcased_target[1:] if normcased_target.startswith("*") and not _HAS_GLOB(normcased_target, 1) else None
+    return _ParsedPattern(is_dir_pattern, is_basename_pattern, target, _compile_glob(target), literal, suffix)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_pattern(pattern_str: str) -> _ParsedPattern:
+    """
+    Parses pattern_str into a _ParsedPattern.
+    Only depends on the pattern string, so it is cached across all paths of a walk.
+    """
+    # Normalize pattern: replace os.sep with /, then process. Nothing to replace on POSIX.
+    norm_pattern = pattern_str if os.sep == "/" else pattern_str.replace(os.sep, "/")
 
     # Case 1: Pattern targets a directory (e.g., "node_modules/", "**/__pycache__/", "*.egg-info/")
-    # These patterns identify a directory name/pattern that, if present anywhere in the path_obj's components,
-    # should cause a match for the directory or any file/subdir within it.
     if norm_pattern.endswith("/"):
         # Extract the core directory name/pattern to match against path components.
-        # e.g., "node_modules/", "**/__pycache__/", "*.egg-info/"
         dir_target_name_pattern = norm_pattern.rstrip("/")  # "node_modules", "**/__pycache__", "*.egg-info"
-
         if dir_target_name_pattern.startswith("**/"):
             # If "**/dirname", the part to match against components is "dirname"
             dir_target_name_pattern = dir_target_name_pattern[3:]  # "__pycache__" or "dirname"
-
-        # Now, dir_target_name_pattern is something like "node_modules", "__pycache__", "*.egg-info"
-        # Check if any component (directory name) in path_obj.parts matches this dir_target_name_pattern.
-        # path_obj.parts for "a/b/c.txt" is ("a", "b", "c.txt")
-        # path_obj.parts for "a/b/c" (dir) is ("a", "b", "c")
-        for part in path_obj.parts:
-            if fnmatch.fnmatch(part, dir_target_name_pattern):
-                return True
-        return False
+        return _new_parsed_pattern(True, False, dir_target_name_pattern)
 
     # Case 2: Pattern targets a file or a path not explicitly ending in "/"
-    # (e.g., "*.py", ".DS_Store", "**/specific.log", "LICENSE")
-    else:
-        if norm_pattern.startswith("**/"):
-            # For patterns like "**/*.log" or "**/exact_filename.txt"
-            # These should match against the base name of the path_obj.
-            file_target_basename_pattern = norm_pattern[3:]  # "*.log" or "exact_filename.txt"
-            return fnmatch.fnmatch(path_obj.name, file_target_basename_pattern)
-        else:
-            # For patterns like "*.py", "README.md", or "data/*.csv".
-            # These are typically matched against the full relative path string.
-            # (fnmatch behavior: "*.py" matches "file.py" but not "dir/file.py")
-            path_str_normalized_for_fnmatch = str(path_obj).replace(os.sep, "/")
-            return fnmatch.fnmatch(path_str_normalized_for_fnmatch, norm_pattern)
+    if norm_pattern.startswith("**/"):
+        # For patterns like "**/*.log" or "**/exact_filename.txt", matched against the base name
+        file_target_basename_pattern = norm_pattern[3:]  # "*.log" or "exact_filename.txt"
+        return _new_parsed_pattern(False, True, file_target_basename_pattern)
+    # For patterns like "*.py", "README.md", or "data/*.csv", matched against the full path
+    return _new_parsed_pattern(False, False, norm_pattern)
+
+
+class _PathInfo(NamedTuple):
+    """
+    The parts of a path string that matching uses, equal to what Path(path_str) would give.
+    Each value is already passed through os.path.normcase, as fnmatch.fnmatch would do per call.
+    """
+
+    parts: Tuple[str, ...]  # Path(path_str).parts
+    name: str  # Path(path_str).name
+    posix_path: str  # str(Path(path_str)) with "/" separators
+
+
+@functools.lru_cache(maxsize=4096)
+def _path_info(path_str: str) -> _PathInfo:
+    """
+    Splits path_str with plain string operations instead of constructing a Path.
+    The same path is checked against many patterns, so the result is cached.
+    """
+    sep = os.sep
+    if os.altsep:
+        path_str = path_str.replace(os.altsep, sep)
+    # Like pathlib: empty and "." segments are dropped, ".." is kept
+    names = [segment for segment in path_str.split(sep) if segment and segment != "."]
+    root = ""
+    if path_str.startswith(sep):
+        # Like pathlib: exactly two leading separators are kept, one or three and more become one
+        root = sep * 2 if path_str.startswith(sep * 2) and not path_str.startswith(sep * 3) else sep
+    parts = (root, *names) if root else tuple(names)
+    # names never contain a separator and root is only separators, so joining with "/"
+    # gives the "/"-separated form directly, without a replace pass
+    posix_path = "/" * len(root) + "/".join(names) if parts else "."
+    normcase = os.path.normcase
+    return _PathInfo(tuple(map(normcase, parts)), normcase(names[-1] if names else ""), normcase(posix_path))
+
+
+def matches_pattern(path_str: str, pattern_str: str) -> bool:
+    """
+    Checks if the given path_str matches the pattern_str.
+    Handles common cases like 'dirname/', '**/dirname/', '*.ext', '**/file.ext'.
+    """
+    return _matches_pattern_cached(path_str, pattern_str)
+
+
+@functools.lru_cache(maxsize=8192)
+def _matches_pattern_cached(path_str: str, pattern_str: str) -> bool:
+    """Implements matches_pattern; the result only depends on the two strings, so it is memoized."""
+    path_info = _path_info(path_str)
+    # Both sides are parsed, normcased and compiled once in their cached records,
+    # so all that is left per call is the regex match itself.
+    parsed = _parse_pattern(pattern_str)
+    regex = parsed.regex
+    # Literal targets (e.g. "LICENSE", "dist/") are compared as strings, skipping the regex engine
+    literal = parsed.literal
+
+    if parsed.is_dir_pattern:
+        # A directory pattern matches the directory or any file/subdir within it,
+        # so check if any component in path_info.parts matches the target.
+        # path_info.parts for "a/b/c.txt" is ("a", "b", "c.txt")
+        # path_info.parts for "a/b/c" (dir) is ("a", "b", "c")
+        if literal is not None:
+            return literal in path_info.parts
+        # map/any run the loop in C and stop at the first matching component
+        return any(map(regex.match, path_info.parts))
+
+    if parsed.is_basename_pattern:
+        if literal is not None:
+            return path_info.name == literal
+        return regex.match(path_info.name) is not None
+
+    # Matched against the full relative path string.
+    # (fnmatch behavior: "*.py" matches "file.py" but not "dir/file.py")
+    if literal is not None:
+        return path_info.posix_path == literal
+    return regex.match(path_info.posix_path) is not None
+
+
+def _combine_regexes(regexes: List["re.Pattern[str]"]) -> Callable[[str], "re.Match[str] | None"] | None:
+    """Joins compiled globs into one alternation regex and returns its match method (None if empty)."""
+    # _compile_glob is cached, so a glob repeated in a pattern list yields the same regex
+    # object; drop the repeats, as on Python 3.10 fnmatch.translate emits named groups
+    # that may not be defined twice in one regex.
+    unique_regexes = list(dict.fromkeys(regexes))
+    if not unique_regexes:
+        return None
+    if len(unique_regexes) == 1:
+        return unique_regexes[0].match
+    try:
+        return re.compile("|".join(f"(?:{regex.pattern})" for regex in unique_regexes)).match
+    except re.error:
+        # The globs cannot share one regex (e.g. clashing group names); try each in turn
+        matchers = [regex.match for regex in unique_regexes]
+
+        def match_any(value: str) -> "re.Match[str] | None":
+            for match in matchers:
+                found = match(value)
+                if found is not None:
+                    return found
+            return None
+
+        return match_any
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern_group(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Builds a matcher equivalent to matches_pattern over all of patterns.
+    Targets of the same kind are split into literals (collected into a set), "*<literal>"
+    suffixes (one str.endswith call over a tuple) and the remaining globs (combined into
+    a single regex). A path is checked with a few set lookups and endswith calls and at
+    most three regex calls (plus one per component for directory patterns) instead of
+    one matches_pattern call per pattern.
+    """
+    parsed_patterns = [_parse_pattern(pattern_str) for pattern_str in patterns]
+
+    def split_kind(
+        kind: List[_ParsedPattern],
+    ) -> Tuple[FrozenSet[str], Tuple[str, ...], Callable[[str], "re.Match[str] | None"] | None]:
+        literals = frozenset(parsed.literal for parsed in kind if parsed.literal is not None)
+        suffixes = tuple(parsed.suffix for parsed in kind if parsed.suffix is not None)
+        regex_match = _combine_regexes(
+            [parsed.regex for parsed in kind if parsed.literal is None and parsed.suffix is None]
+        )
+        return literals, suffixes, regex_match
+
+    dir_literals, dir_suffixes, dir_match = split_kind([parsed for parsed in parsed_patterns if parsed.is_dir_pattern])
+    basename_literals, basename_suffixes, basename_match = split_kind(
+        [parsed for parsed in parsed_patterns if parsed.is_basename_pattern]
+    )
+    full_path_literals, full_path_suffixes, full_path_match = split_kind(
+        [parsed for parsed in parsed_patterns if not parsed.is_dir_pattern and not parsed.is_basename_pattern]
+    )
+
+    has_dir_patterns = bool(dir_literals) or bool(dir_suffixes) or dir_match is not None
+
+    def component_matches(part: str) -> bool:
+        return (
+            part in dir_literals
+            or part.endswith(dir_suffixes)
+            or (dir_match is not None and dir_match(part) is not None)
+        )
+
+    # Files in the same directory share all but their last component, so whether any
+    # parent component matches a directory pattern is cached per parent directory
+    @functools.lru_cache(maxsize=4096)
+    def parent_components_match(parent_parts: Tuple[str, ...]) -> bool:
+        return any(map(component_matches, parent_parts))
+
+    def matches(path_str: str) -> bool:
+        path_info = _path_info(path_str)
+        parts = path_info.parts
+        return (
+            (has_dir_patterns and bool(parts) and (component_matches(parts[-1]) or parent_components_match(parts[:-1])))
+            or path_info.name in basename_literals
+            or path_info.posix_path in full_path_literals
+            or path_info.name.endswith(basename_suffixes)
+            or path_info.posix_path.endswith(full_path_suffixes)
+            or (basename_match is not None and basename_match(path_info.name) is not None)
+            or (full_path_match is not None and full_path_match(path_info.posix_path) is not None)
+        )
+
+    return matches
+
+
+def compile_patterns(patterns: List[str]) -> Callable[[str], bool]:
+    """
+    Returns a function that checks if a path string matches any of the provided patterns.
+    Callers that test many paths against the same list (e.g. a directory walk) should
+    build it once, rather than having matches_patterns look it up again for every path.
+    """
+    return _compile_pattern_group(tuple(patterns))
 
 
 def matches_patterns(
     path_str: str, patterns: List[str]
 ) -> bool:  # Changed from list[str] to List[str] for older Pythons if needed
     """Checks if the path_str matches any of the provided patterns."""
-    for pattern_item in patterns:
-        if matches_pattern(path_str, pattern_item):
-            return True
-    return False
+    return compile_patterns(patterns)(path_str)
 
 
-def is_path_hidden(path_obj: Path) -> bool:
+def is_path_hidden(path_str: str) -> bool:
     """
     Checks if any part of the path starts with a '.' character,
-    excluding the root '.' itself if path_obj is Path(".").
+    excluding the root '.' itself if path_str is ".".
+    path_str is expected in str(Path) form, as core builds its relative paths.
     """
-    # Path(".").parts is ('.',), Path(".git").parts is ('.git',)
-    # Path("src/.config").parts is ("src", ".config")
-    return any(part.startswith(".") for part in path_obj.parts if part not in (".", os.sep))
+    # str() of a Path is normalized: no "." segments (Path(".") is just "."), no repeated
+    # separators, so a part starts with "." exactly when the string starts with "."
+    # or contains a separator followed by ".". Scanning the string avoids building .parts.
+    return (path_str.startswith(".") and path_str != ".") or (os.sep + ".") in path_str
@@ -72,8 +72,8 @@ def mock_pyperclip(monkeypatch):
     def custom_pyperclip_paste():
         return mock_paste_object()
 
-    monkeypatch.setattr("dirdigest.utils.clipboard.pyperclip.copy", custom_pyperclip_copy)
-    monkeypatch.setattr("dirdigest.utils.clipboard.pyperclip.paste", custom_pyperclip_paste)
+    monkeypatch.setattr("pyperclip.copy", custom_pyperclip_copy)
+    monkeypatch.setattr("pyperclip.paste", custom_pyperclip_paste)
 
     try:
         import pyperclip
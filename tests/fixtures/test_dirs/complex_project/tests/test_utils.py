@@ -0,0 +1 @@
+# test utils
@@ -0,0 +1,18 @@
+ndYUu7jpZxQOUFZUus3syUCGHEGiXwTZPxpg0ExD9TFED17BWrYEPhQCUw6b1MTdlB9QAUKNHX1e
+Tlobp8cArRAjQcEdSrsJM4MqYJlgHkkPVUMBJWB1gi1/58WvR79loLi2yuKx9fgqW4dZ5ZeE9a/Z
+DX1V8HEMvg0vZfF4JQLW/uwYCvWx+cTCIi5bYlL6tVVcQnc78ipU+oyvkSNFCQjqb1g4OLilho/D
+edweoJbGO49jw/T+LPFrmrG2cVVhzGQSmFMBVoual2ifT9DUNixevQDE2YUI0uHYlKBniiwKBEED
+8+/22wEYD/W+jNUqRZmG1MQ87UbSd5RYejP8SyXdzEefG7a7te7QX5HJ3G2mP3PdJGR2XJXL3w88
+pwYlzqWwQ+oPjnuAyAUN90x6lT9aV63R3m7y8SWeszGlgHytKUmT9qxLCdJeA0WEqF84P4/93+hY
+MnGXUbVIVzC2awx1tBtvVY/c1RmEnKh/ocPD1IO0QsqLZkNg5AEfRJOVerlRzKuWo6hlfNubzJk2
+1j874L6miV+FO+A+OztkCST3GrCkJpSrhGT/bZbi3IdwPxL6zycO2V3Wl9wzvQHE7oMDht2wg1YE
+TPY9LeNs03aUxkYeN6lD6ZrePR0fWp1ZdTB43j3pkFHpvBTZUk11PHX53L8SFyTHWmVEJGmldRlP
+R1HqcC6H9JMrZRFldaTBQzlU5fqZC7CPTVEw3cS6972e0C+3Fqs4G5wxIRX5pz7zhDNBltGM6tWb
+hRYNAySQVSiGiLS4BsxPd2cJYjunNhfpDbKQ61hIa7R91wJAKCWES9sC0l0Sumce0OMEjnslFkW9
++qFL+V71L0jtR9PmSl8ICULfCbInBx7JALqXOtG3Bt3A/rshqR1KuCet94huSB+UCb20z58wXGBY
+dRma7dDmZJfQD8ok0a8VVQ73N4pbwx6g/W+d4CXT62NwdYgDtMVeD5O1l7lBLWhNkNWpiiTJF+SB
+fq/Y1BcAU0mMWfXdYy9Aeca6ptcXe+LcfxTqlXvNk+0rR+OAJgEvR+C1TEPUAK3cpRh16nH5Wnmg
+3ZJ16N9CNXc1XKpq/xLtTaIWOUoRs2Lx6JM7/jnrQDYB3XYdUAn0RAV4e3FzRgFPt5GwvW8EiBB9
+Qe5jMJNjDBocXnewZa8nys97nQ5i2z0REcyqF/9pvCX/3PWn83VxttX/EVjgBe2JbZpmQUJTnZEl
+KfbD003T30CSA55CU3G98BH73WfBJLC3Y11eYMqCha9UAmxoC1DEKi+8Uf8Td6sOkZfCcm8cW3/c
+aW3PiYOUFNCA3nEOBhZwGu5c8wpuUJwhlgvc1qTa0GqcpQPkVa0Vj2WFlkaHUuppNTwxqwy/fg==
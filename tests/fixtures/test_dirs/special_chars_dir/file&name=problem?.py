@@ -0,0 +1 @@
+Special chars
@@ -335,7 +335,7 @@ def test_cli_boolean_flags_for_core(
     assert kwargs.get(arg_name_in_core) == expected_value
 
 
-@mock.patch("dirdigest.utils.clipboard.pyperclip.copy")  # Mock the actual copy action
+@mock.patch("pyperclip.copy")  # Mock the actual copy action
 @pytest.mark.parametrize("temp_test_dir", ["simple_project"], indirect=True)
 def test_cli_no_clipboard_option(mock_pyperclip_copy, runner: CliRunner, temp_test_dir: Path):
     """
@@ -355,7 +355,7 @@ def test_cli_no_clipboard_option(mock_pyperclip_copy, runner: CliRunner, temp_te
 
 @pytest.mark.parametrize("temp_test_dir", ["simple_project"], indirect=True)
 @mock.patch("dirdigest.cli.is_running_in_wsl", return_value=False)
-@mock.patch("dirdigest.utils.clipboard.pyperclip.copy")
+@mock.patch("pyperclip.copy")
 def test_cli_clipboard_copies_dir_path_when_output_file_not_in_wsl(
     mock_pyperclip_copy,
     mock_is_wsl,
@@ -376,7 +376,7 @@ def test_cli_clipboard_copies_dir_path_when_output_file_not_in_wsl(
 @pytest.mark.parametrize("temp_test_dir", ["simple_project"], indirect=True)
 @mock.patch("dirdigest.cli.is_running_in_wsl", return_value=True)
 @mock.patch("dirdigest.cli.convert_wsl_path_to_windows")
-@mock.patch("dirdigest.utils.clipboard.pyperclip.copy")
+@mock.patch("pyperclip.copy")
 def test_cli_clipboard_copies_wsl_dir_path_when_output_file_in_wsl(
     mock_pyperclip_copy,
     mock_convert_wsl_path,
@@ -409,7 +409,7 @@ def test_cli_clipboard_copies_wsl_dir_path_when_output_file_in_wsl(
 @pytest.mark.parametrize("temp_test_dir", ["simple_project"], indirect=True)
 @mock.patch("dirdigest.cli.is_running_in_wsl", return_value=True)
 @mock.patch("dirdigest.cli.convert_wsl_path_to_windows", return_value=None)
-@mock.patch("dirdigest.utils.clipboard.pyperclip.copy")
+@mock.patch("pyperclip.copy")
 def test_cli_clipboard_wsl_dir_path_conversion_fails_copies_linux_dir_path(
     mock_pyperclip_copy,
     mock_convert_wsl_path_fails,
@@ -429,7 +429,7 @@ def test_cli_clipboard_wsl_dir_path_conversion_fails_copies_linux_dir_path(
 
 
 @pytest.mark.parametrize("temp_test_dir", ["simple_project"], indirect=True)
-@mock.patch("dirdigest.utils.clipboard.pyperclip.copy")
+@mock.patch("pyperclip.copy")
 def test_cli_clipboard_copies_content_when_no_output_file(
     mock_pyperclip_copy,
     runner: CliRunner,
@@ -470,3 +470,29 @@ def test_cli_clipboard_copies_content_when_no_output_file(
 
     # To test content copying, a separate test with "-o -" would be needed.
     # This test now verifies the default behavior (output to file, dir path to clipboard).
+
+
+def test_is_clipboard_available_probes_only_once(mock_pyperclip, monkeypatch):
+    """The clipboard probe (a paste, which may spawn a subprocess) runs once and its result is cached."""
+    from dirdigest.utils import clipboard as dirdigest_clipboard
+
+    _, mock_paste, _ = mock_pyperclip
+    monkeypatch.setattr(dirdigest_clipboard, "_CLIPBOARD_AVAILABLE", None)
+
+    assert dirdigest_clipboard.is_clipboard_available() is True
+    assert dirdigest_clipboard.is_clipboard_available() is True
+    mock_paste.assert_called_once()
+
+
+def test_cli_import_does_not_import_pyperclip():
+    """pyperclip is imported lazily, only when the clipboard is actually used."""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, dirdigest.cli; print('pyperclip' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -11,7 +11,7 @@ from click.testing import CliRunner
 from dirdigest import cli as dirdigest_cli
 from dirdigest.constants import TOOL_VERSION
 from dirdigest.core import LogEvent  # For type hinting
-from dirdigest.formatter import format_log_event_for_cli  # Function to test
+from dirdigest.formatter import RICH_TAG_RE, TARGET_COL, format_log_event_for_cli  # Function to test
 
 # --- Helper for checking log lines ---
 
@@ -138,6 +138,29 @@ def test_format_log_event_minimal_data():
     )
 
 
+@pytest.mark.parametrize(
+    "status, item_type, size_kb",
+    [
+        ("included", "file", 2.345),
+        ("excluded", "folder", 10240.0),
+        ("error", "file", "very large"),
+        ("unknown", "item", 0.0),
+    ],
+)
+def test_format_log_event_colon_alignment(status, item_type, size_kb):
+    log_event: LogEvent = {
+        "path": "src/main.py",
+        "item_type": item_type,
+        "status": status,
+        "size_kb": size_kb,
+        "reason": None,
+    }
+    result = format_log_event_for_cli(log_event)
+    left_part = result.split(": [log.path]", 1)[0]
+    # The colon is aligned at TARGET_COL once the [log.*] tags are stripped
+    assert len(RICH_TAG_RE.sub("", left_part)) == TARGET_COL
+
+
 # --- Existing tests for JSON/Markdown output format ---
 
 
@@ -398,3 +421,163 @@ def test_json_output_metadata_and_root_structure(runner: CliRunner, temp_test_di
     # Check that children are sorted (folders first, then files, all alphabetically)
     child_paths = [c["relative_path"].replace(os.sep, "/") for c in root_node["children"]]
     assert child_paths == ["sub_dir1", "file1.txt", "file2.md"]
+
+
+def test_markdown_formatter_handles_tree_deeper_than_recursion_limit():
+    """The Markdown tree walk is iterative, so very deep trees do not raise RecursionError."""
+    import sys
+
+    from dirdigest.formatter import MarkdownFormatter
+
+    depth = sys.getrecursionlimit() + 100
+    root_node = {"relative_path": ".", "type": "folder", "children": []}
+    current_node = root_node
+    current_path = Path(".")
+    for level in range(depth):
+        current_path = current_path / f"d{level}"
+        folder_node = {"relative_path": str(current_path), "type": "folder", "children": []}
+        current_node["children"].append(folder_node)
+        current_node = folder_node
+    current_node["children"].append(
+        {"relative_path": str(current_path / "leaf.py"), "type": "file", "size_kb": 0.0, "content": "x = 1"}
+    )
+    metadata = {
+        "base_directory": "/tmp/deep",
+        "included_files_count": 1,
+        "excluded_items_count": 0,
+        "total_content_size_kb": 0.0,
+    }
+
+    output = MarkdownFormatter(Path("/tmp/deep"), metadata).format(root_node)
+
+    assert f"{'    ' * depth}└── leaf.py" in output
+    assert f"### `./{current_path / 'leaf.py'}`" in output
+    assert "```py\nx = 1\n```" in output
+
+
+def test_json_formatter_keeps_non_ascii():
+    from dirdigest.formatter import JsonFormatter
+
+    root_node = {
+        "relative_path": ".",
+        "type": "folder",
+        "children": [{"relative_path": "notes.txt", "type": "file", "size_kb": 0.01, "content": "café ✓"}],
+    }
+    metadata = {"base_directory": "/tmp/unicode", "included_files_count": 1}
+    formatter = JsonFormatter(Path("/tmp/unicode"), metadata)
+
+    json_output = formatter.format(root_node)
+    assert "café ✓" in json_output  # Not escaped as \uXXXX
+    assert json.loads(json_output)["root"]["children"][0]["content"] == "café ✓"
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_formatter_escapes_surrogates_from_undecodable_names(monkeypatch, use_orjson):
+    """Names with undecodable bytes (surrogateescape) still give UTF-8 encodable JSON."""
+    from dirdigest.formatter import JsonFormatter
+
+    if use_orjson:
+        pytest.importorskip("orjson")  # orjson rejects lone surrogates; the stdlib fallback must take over
+    monkeypatch.setattr(JsonFormatter, "use_orjson", use_orjson)
+    bad_name = os.fsdecode(b"bad\xff.txt")  # "bad\udcff.txt" on POSIX
+    root_node = {
+        "relative_path": ".",
+        "type": "folder",
+        "children": [{"relative_path": bad_name, "type": "file", "size_kb": 0.01, "content": "café"}],
+    }
+    formatter = JsonFormatter(Path("/tmp/x"), {"base_directory": "/tmp/x", "included_files_count": 1})
+
+    json_output = formatter.format(root_node)
+
+    json_output.encode("utf-8")  # Must not raise UnicodeEncodeError
+    assert "café" in json_output
+    assert json.loads(json_output)["root"]["children"][0]["relative_path"] == bad_name
+
+
+def test_json_formatter_orjson_output_matches_stdlib(monkeypatch):
+    """Both encoders agree for the kinds of values dirdigest emits (not for arbitrary floats or big ints)."""
+    pytest.importorskip("orjson")
+    from dirdigest.formatter import JsonFormatter
+
+    root_node = {
+        "relative_path": ".",
+        "type": "folder",
+        "children": [
+            {"relative_path": "a.py", "type": "file", "size_kb": 0.157, "content": 'print("héllo")\n\t'},
+            {"relative_path": "b", "type": "folder", "children": []},
+        ],
+    }
+    metadata = {"base_directory": "/tmp/x", "included_files_count": 1, "total_content_size_kb": 0.157}
+    formatter = JsonFormatter(Path("/tmp/x"), metadata)
+
+    monkeypatch.setattr(JsonFormatter, "use_orjson", True)
+    orjson_output = formatter.format(root_node)
+    monkeypatch.setattr(JsonFormatter, "use_orjson", False)
+    stdlib_output = formatter.format(root_node)
+
+    assert orjson_output == stdlib_output
+
+
+def test_json_formatter_falls_back_to_stdlib_when_orjson_rejects(monkeypatch):
+    """Values orjson refuses (here an int wider than 64 bits) are encoded by json instead of raising."""
+    pytest.importorskip("orjson")
+    from dirdigest.formatter import JsonFormatter
+
+    root_node = {"relative_path": ".", "type": "folder", "children": []}
+    formatter = JsonFormatter(Path("/tmp/x"), {"base_directory": "/tmp/x", "included_files_count": 2**64})
+
+    monkeypatch.setattr(JsonFormatter, "use_orjson", True)
+    orjson_output = formatter.format(root_node)
+    monkeypatch.setattr(JsonFormatter, "use_orjson", False)
+    stdlib_output = formatter.format(root_node)
+
+    assert orjson_output == stdlib_output
+    assert json.loads(orjson_output)["metadata"]["included_files_count"] == 2**64
+
+
+def test_formatters_reuse_created_at_from_metadata():
+    from dirdigest.formatter import JsonFormatter, MarkdownFormatter
+
+    metadata = {
+        "base_directory": "/tmp/x",
+        "included_files_count": 0,
+        "total_content_size_kb": 0.0,
+        "created_at": "2024-01-02T03:04:05",
+    }
+    json_formatter = JsonFormatter(Path("/tmp/x"), metadata)
+    markdown_formatter = MarkdownFormatter(Path("/tmp/x"), metadata)
+
+    assert json_formatter.final_metadata["created_at"] == "2024-01-02T03:04:05"
+    assert markdown_formatter.final_metadata["created_at"] == "2024-01-02T03:04:05"
+    # created_at stays the last key, after tool_version
+    assert list(json_formatter.final_metadata)[-2:] == ["tool_version", "created_at"]
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_formatter_serializes_path_metadata(monkeypatch, use_orjson):
+    from dirdigest.formatter import JsonFormatter
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(JsonFormatter, "use_orjson", use_orjson)
+    root_node = {"relative_path": ".", "type": "folder", "children": []}
+    metadata = {"base_directory": Path("/tmp/x"), "included_files_count": 0}
+
+    parsed = json.loads(JsonFormatter(Path("/tmp/x"), metadata).format(root_node))
+
+    assert parsed["metadata"]["base_directory"] == str(Path("/tmp/x"))
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_formatter_serializes_nested_path_metadata(monkeypatch, use_orjson):
+    from dirdigest.formatter import JsonFormatter
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(JsonFormatter, "use_orjson", use_orjson)
+    root_node = {"relative_path": ".", "type": "folder", "children": []}
+    metadata = {"base_directory": "/tmp/x", "extra": {"paths": [Path("/tmp/x/a")]}}
+
+    parsed = json.loads(JsonFormatter(Path("/tmp/x"), metadata).format(root_node))
+
+    assert parsed["metadata"]["extra"]["paths"] == [str(Path("/tmp/x/a"))]
@@ -2,6 +2,7 @@
 
 import json
 import os
+import re
 from pathlib import Path
 from unittest import mock
 
@@ -9,6 +10,7 @@ import pytest
 from click.testing import CliRunner
 
 from dirdigest import cli as dirdigest_cli
+from dirdigest.utils.patterns import _combine_regexes, is_path_hidden, matches_pattern, matches_patterns
 
 
 # Helper function to extract relative paths from JSON output
@@ -628,3 +630,84 @@ def test_broken_symlinks_handling(runner: CliRunner, temp_test_dir: Path):
         ), "broken_link node should have no content due to read_error"
     finally:
         os.chdir(original_cwd)
+
+
+@pytest.mark.parametrize(
+    "path_str, pattern_str, expected",
+    [
+        ("node_modules/pkg/index.js", "node_modules/", True),
+        ("src/__pycache__/mod.pyc", "**/__pycache__/", True),
+        ("src/pkg.egg-info", "*.egg-info/", True),
+        ("src/app.py", "node_modules/", False),
+        ("logs/deep/app.log", "**/*.log", True),
+        ("logs/deep/app.txt", "**/*.log", False),
+        ("file.py", "*.py", True),
+        ("data/file.csv", "data/*.csv", True),
+        ("data/sub/file.csv", "data/*.csv", True),  # fnmatch's "*" also matches "/"
+        ("LICENSE", "LICENSE", True),
+        ("docs/LICENSE", "LICENSE", False),
+    ],
+)
+def test_matches_pattern_kinds(path_str: str, pattern_str: str, expected: bool):
+    """Each kind of pattern (directory, '**/' base name, full path) matches as documented."""
+    assert matches_pattern(path_str, pattern_str) is expected
+    # A second call is served by the cached pattern parse and must agree
+    assert matches_pattern(path_str, pattern_str) is expected
+
+
+@pytest.mark.parametrize(
+    "path_str",
+    [
+        "src/app.py",
+        "node_modules/pkg/index.js",
+        "logs/app.log",
+        "LICENSE",
+        "docs/LICENSE",
+        "data/x.csv",
+        "notes.txt",
+        "src/pkg.egg-info/PKG-INFO",
+    ],
+)
+def test_matches_patterns_agrees_with_matches_pattern(path_str: str):
+    """The combined matcher gives the same answer as checking each pattern on its own."""
+    patterns = ["node_modules/", "**/*.log", "LICENSE", "data/*.csv", "*.py", "*.egg-info/"]
+    assert matches_patterns(path_str, patterns) is any(matches_pattern(path_str, p) for p in patterns)
+    assert matches_patterns(path_str, []) is False
+
+
+@pytest.mark.parametrize(
+    "path_str, patterns, expected",
+    [
+        ("a1b2c", ["a*b*c", "a*b*c"], True),
+        ("a1b2d", ["a*b*c", "a*b*c"], False),
+        ("src/x1y2z/file.txt", ["**/x*y*z/", "x*y*z/"], True),
+        ("logs/a1b2c", ["**/a*b*c", "**/a*b*c"], True),
+    ],
+)
+def test_matches_patterns_repeated_multi_star_glob(path_str: str, patterns: list, expected: bool):
+    """A glob repeated in one list must not break the combined regex (named groups on Python 3.10)."""
+    assert matches_patterns(path_str, patterns) is expected
+
+
+def test_combine_regexes_falls_back_when_groups_clash():
+    """Regexes that cannot be joined into one alternation are tried one by one."""
+    match = _combine_regexes([re.compile(r"(?P<g0>a)\Z"), re.compile(r"(?P<g0>b)\Z")])
+    assert match is not None
+    assert match("a") is not None
+    assert match("b") is not None
+    assert match("c") is None
+
+
+@pytest.mark.parametrize(
+    "path_str, expected",
+    [
+        (".", False),
+        (".git", True),
+        ("src/.config/app.ini", True),
+        ("src/app.py", False),
+        ("src/file.with.dots", False),
+        ("..", True),
+    ],
+)
+def test_is_path_hidden(path_str: str, expected: bool):
+    assert is_path_hidden(str(Path(path_str))) is expected